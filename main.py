@@ -1,16 +1,65 @@
 import json
 import os
+import queue
 import re
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, date
+from operator import attrgetter, itemgetter
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import Calendar  # 日历控件
 import uuid  # 生成唯一ID
 import pytz  # 时区支持（当前代码中未使用）
 
+# 优先使用C实现的orjson做JSON读写（比标准库json快数倍），未安装时回退到标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    # 从bytes/str反序列化JSON
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    # 序列化为bytes（orjson直接输出bytes并原生支持date对象，回退路径用default=str转换）
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+# 多任务描述的序号后缀，如 " (2/5)"（模块加载时编译一次，避免每次调用重新编译）
+_MULTI_SUFFIX_RE = re.compile(r' \(\d+/\d+\)$')
+
+# 提取学习记录时长字段（C实现，配合map使用时sum整个在C层循环）
+_get_duration = itemgetter("duration")
+
+
+# ISO日期解析函数（fromisoformat是C实现，比strptime快且无locale查询）
+def _parse_date(s):
+    # 解析 "YYYY-MM-DD" 格式的日期字符串
+    return date.fromisoformat(s)
+
+
+def _parse_dt(s):
+    # 解析 "YYYY-MM-DD HH:MM:SS" 格式的时间字符串
+    return datetime.fromisoformat(s)
+
 
 # 任务类，存储单个任务的所有属性和行为
 class Task:
+    # 组代表任务才会覆盖的属性，给普通任务一个类级默认值，
+    # 访问时无需hasattr（hasattr内部走try/except，热路径上开销可观）
+    is_group_task = False
+    base_description = None
+
     def __init__(self, description, start_date=None, due_date=None, completed=False, task_id=None, created_at=None,
                  is_multi=False, multi_index=None, multi_total=None, group_id=None, importance=1, details=""):
         # 任务唯一标识符，如果未提供则生成新的UUID
@@ -35,30 +84,66 @@ class Task:
         # 任务重要性等级（1-5）
         self.importance = importance
 
+    # 拦截属性赋值：任何公开属性被修改时，使缓存的序列化结果、搜索文本和日期字符串失效
+    def __setattr__(self, name, value):
+        if not name.startswith('_'):
+            self.__dict__['_dict_cache'] = None
+            self.__dict__['_search_blob'] = None
+            self.__dict__['_start_date_str'] = None
+            self.__dict__['_due_date_str'] = None
+        object.__setattr__(self, name, value)
+
+    # 用于搜索的小写文本（描述+详情），缓存避免每次按键都重新lower()
+    @property
+    def search_blob(self):
+        blob = self._search_blob
+        if blob is None:
+            blob = self._search_blob = (self.description + "\n" + self.details).lower()
+        return blob
+
+    # 显示用的格式化日期字符串（无日期时为空串），缓存避免每次刷新列表都格式化
+    @property
+    def start_date_str(self):
+        s = self._start_date_str
+        if s is None:
+            s = self._start_date_str = self.start_date.isoformat() if self.start_date else ""
+        return s
+
+    @property
+    def due_date_str(self):
+        s = self._due_date_str
+        if s is None:
+            s = self._due_date_str = self.due_date.isoformat() if self.due_date else ""
+        return s
+
     # 将任务对象转换为字典格式（用于JSON序列化）
+    # 结果会缓存在任务上，只有属性变化后才重新构建（避免每次保存都调用strftime）
     def to_dict(self):
-        return {
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "id": self.id,
             "description": self.description,
             "details": self.details,
-            "start_date": self.start_date.strftime("%Y-%m-%d") if self.start_date else None,
-            "due_date": self.due_date.strftime("%Y-%m-%d") if self.due_date else None,
+            "start_date": self.start_date.isoformat() if self.start_date else None,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
             "completed": self.completed,
-            "created_at": self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "created_at": self.created_at.isoformat(sep=' ', timespec='seconds'),
             "is_multi": self.is_multi,
             "multi_index": self.multi_index,
             "multi_total": self.multi_total,
             "group_id": self.group_id,
             "importance": self.importance
         }
+        return self._dict_cache
 
     # 类方法：从字典创建任务对象（用于JSON反序列化）
     @classmethod
     def from_dict(cls, data):
         # 解析日期字符串为date对象
-        start_date = datetime.strptime(data["start_date"], "%Y-%m-%d").date() if data["start_date"] else None
-        due_date = datetime.strptime(data["due_date"], "%Y-%m-%d").date() if data["due_date"] else None
-        created_at = datetime.strptime(data["created_at"], "%Y-%m-%d %H:%M:%S") if data["created_at"] else None
+        start_date = _parse_date(data["start_date"]) if data["start_date"] else None
+        due_date = _parse_date(data["due_date"]) if data["due_date"] else None
+        created_at = _parse_dt(data["created_at"]) if data["created_at"] else None
 
         # 获取多任务相关属性（带默认值）
         is_multi = data.get("is_multi", False)
@@ -90,6 +175,17 @@ class TaskManager:
     def __init__(self, filename='tasks.json'):
         self.filename = filename  # 任务存储文件
         self.tasks = []  # 内存中的任务列表
+        self._dirty = False  # 自上次保存后任务是否有改动
+        self._version = 0  # 任务数据版本号，每次变化递增，供外部缓存判断是否失效
+        # 按起始日期排序的索引（懒构建，任务变动后置为None失效）
+        self._by_start = None  # 有起始日期的任务，按start_date升序
+        self._by_start_keys = None  # 与_by_start对应的start_date列表，供bisect使用
+        self._by_id = {}  # id -> 任务，点击/编辑时O(1)定位
+        self._by_group = defaultdict(list)  # group_id -> 组内任务列表
+        # 后台写盘线程：主线程只做序列化和入队，磁盘写入不再卡住界面
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
         self.load_tasks()  # 初始化时加载任务
 
 
@@ -98,8 +194,8 @@ class TaskManager:
     def load_tasks(self):
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
+                with open(self.filename, 'rb') as f:
+                    data = _json_loads(f.read())
                     # 将字典数据转换为Task对象
                     self.tasks = [Task.from_dict(task) for task in data]
             except:
@@ -107,12 +203,66 @@ class TaskManager:
                 self.tasks = []
         else:
             self.tasks = []
-
-    # 保存任务到文件
+        self._by_start = None  # 重新加载后索引失效
+        self._version += 1
+        self._reindex()
+
+    # 重建 id->任务 与 group_id->组内任务 的索引
+    def _reindex(self):
+        self._by_id = {t.id: t for t in self.tasks}
+        self._by_group = defaultdict(list)
+        for t in self.tasks:
+            if t.group_id:
+                self._by_group[t.group_id].append(t)
+
+    # 后台线程循环：取出最新快照并原子写入文件
+    # 写入失败（如Windows下文件被杀毒/备份软件短暂锁住）时不能让线程挂掉，
+    # 否则之后的保存都会入队无人处理；重新标记_dirty让下一次auto_save重试
+    def _save_worker(self):
+        while True:
+            payload = self._save_queue.get()
+            try:
+                tmp = self.filename + '.tmp'
+                with open(tmp, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp, self.filename)
+            except OSError as e:
+                self._dirty = True
+                print(f"保存任务失败，将在下次自动保存时重试: {e}")
+            finally:
+                self._save_queue.task_done()
+
+    # 等待队列中的快照全部写完（程序退出前调用，防止最后一次保存被丢弃）
+    def flush_saves(self):
+        self._save_queue.join()
+        if self._dirty:
+            # 后台写入失败过：退出前在当前线程同步再写一次兜底
+            try:
+                tmp = self.filename + '.tmp'
+                with open(tmp, 'wb') as f:
+                    f.write(_json_dumps([task.to_dict() for task in self.tasks]))
+                os.replace(tmp, self.filename)
+                self._dirty = False
+            except OSError as e:
+                print(f"退出前保存任务失败: {e}")
+
+    # 保存任务到文件（无改动时跳过）
+    # 在调用线程完成序列化（开销小），写盘交给后台线程；
+    # 若队列中还有未写出的旧快照则直接覆盖，连续保存合并为一次写盘
     def save_tasks(self):
-        with open(self.filename, 'w') as f:
-            # 将Task对象列表转换为字典列表
-            json.dump([task.to_dict() for task in self.tasks], f, indent=2)
+        if not self._dirty:
+            return
+        payload = _json_dumps([task.to_dict() for task in self.tasks])
+        try:
+            self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            pass
+        self._save_queue.put(payload)
+        self._dirty = False
+        self._version += 1
+        # 任何保存都意味着任务可能有变动，使日期索引失效
+        self._by_start = None
 
     # 添加单个任务
     def add_task(self, description, start_date, due_date, is_multi=False, multi_index=None, multi_total=None,
@@ -123,6 +273,10 @@ class TaskManager:
                     importance=importance, details=details)
         # 添加到列表并保存
         self.tasks.append(task)
+        self._by_id[task.id] = task
+        if task.group_id:
+            self._by_group[task.group_id].append(task)
+        self._dirty = True
         self.save_tasks()
         return task
 
@@ -153,43 +307,73 @@ class TaskManager:
                 details=details  # 所有子任务共享相同的详情
             )
             self.tasks.append(task)
+            self._by_id[task.id] = task
+            self._by_group[group_id].append(task)
             tasks_added.append(task)
 
+        self._dirty = True
         self.save_tasks()
         return tasks_added
 
     # 编辑现有任务
     def edit_task(self, task_id, description, start_date, due_date, is_multi, multi_index=None, multi_total=None,
                   importance=1, details=""):
-        for task in self.tasks:
-            if task.id == task_id:
-                # 更新任务属性
-                task.description = description
-                task.start_date = start_date.date() if isinstance(start_date, datetime) else start_date
-                task.due_date = due_date.date() if isinstance(due_date, datetime) else due_date
-                task.is_multi = is_multi
-                task.multi_index = multi_index
-                task.multi_total = multi_total
-                task.importance = importance
-                task.details = details  # 更新任务详情
-                self.save_tasks()
-                return True
-        return False  # 未找到任务
+        task = self._by_id.get(task_id)
+        if task is None:
+            return False  # 未找到任务
+
+        new_start = start_date.date() if isinstance(start_date, datetime) else start_date
+        new_due = due_date.date() if isinstance(due_date, datetime) else due_date
+
+        # 内容没有实际变化时直接返回，避免无意义的缓存失效和整文件重写
+        if (task.description == description and task.start_date == new_start
+                and task.due_date == new_due and task.is_multi == is_multi
+                and task.multi_index == multi_index and task.multi_total == multi_total
+                and task.importance == importance and task.details == details):
+            return True
+
+        # 更新任务属性
+        task.description = description
+        task.start_date = new_start
+        task.due_date = new_due
+        task.is_multi = is_multi
+        task.multi_index = multi_index
+        task.multi_total = multi_total
+        task.importance = importance
+        task.details = details  # 更新任务详情
+        self._dirty = True
+        self.save_tasks()
+        return True
+
+    # 批量删除任务：一次过滤、一次保存，而不是每个ID各重建列表并写盘一遍
+    def delete_tasks(self, task_ids):
+        ids = set(task_ids)
+        self.tasks = [task for task in self.tasks if task.id not in ids]
+        self._reindex()
+        self._dirty = True
+        self.save_tasks()
 
-    # 删除任务
+    # 删除单个任务（委托给批量接口）
     def delete_task(self, task_id):
-        # 过滤掉指定ID的任务
-        self.tasks = [task for task in self.tasks if task.id != task_id]
-        self.save_tasks()
+        self.delete_tasks((task_id,))
 
     # 切换任务完成状态
     def toggle_completion(self, task_id):
-        for task in self.tasks:
-            if task.id == task_id:
-                task.completed = not task.completed
-                self.save_tasks()
-                return True
-        return False
+        task = self._by_id.get(task_id)
+        if task is None:
+            return False
+        task.completed = not task.completed
+        self._dirty = True
+        self.save_tasks()
+        return True
+
+    # 重建按起始日期排序的索引（无起始日期的任务不参与日期查询）
+    def _rebuild_date_index(self):
+        self._by_start = sorted(
+            (t for t in self.tasks if t.start_date is not None),
+            key=lambda t: t.start_date
+        )
+        self._by_start_keys = [t.start_date for t in self._by_start]
 
     # 获取特定日期的任务
     def get_tasks_by_date(self, target_date):
@@ -200,20 +384,16 @@ class TaskManager:
         # 统一为date类型
         target_date = target_date.date() if isinstance(target_date, datetime) else target_date
 
-        results = []
-        for task in self.tasks:
-            # 跳过无起始日期的任务
-            if task.start_date is None:
-                continue
+        if self._by_start is None:
+            self._rebuild_date_index()
 
-            if task.due_date is None:
-                # 无截止日期：从起始日期开始的所有任务
-                if target_date >= task.start_date:
-                    results.append(task)
-            else:
-                # 有起止日期：检查目标日期是否在范围内
-                if task.start_date <= target_date <= task.due_date:
-                    results.append(task)
+        # 二分定位所有 start_date <= target_date 的候选任务，再按截止日期过滤
+        idx = bisect_right(self._by_start_keys, target_date)
+        results = []
+        for task in self._by_start[:idx]:
+            # 无截止日期：从起始日期开始一直有效；有截止日期：检查是否已过期
+            if task.due_date is None or target_date <= task.due_date:
+                results.append(task)
 
         return results
 
@@ -223,9 +403,10 @@ class TaskManager:
         return self.get_tasks_by_date(today)
 
     # 获取分组后的任务（多任务组显示为单个代表任务）
+    # 一次遍历按group_id分桶，再逐组聚合，整体O(n)而不是每组重扫全表
     def get_all_tasks_grouped(self):
-        grouped_tasks = []  # 结果列表
-        seen_groups = set()  # 已处理的多任务组
+        grouped_tasks = []  # 结果列表（保持原有顺序：单任务和组首次出现的位置）
+        groups = {}  # group_id -> 组内任务列表
 
         for task in self.tasks:
             # 单任务直接添加
@@ -233,47 +414,67 @@ class TaskManager:
                 grouped_tasks.append(task)
                 continue
 
-            # 检查多任务组是否已处理
-            if task.group_id not in seen_groups:
-                # 获取组内所有任务
-                group_tasks = [t for t in self.tasks if t.group_id == task.group_id]
-
-                # 计算组的起始和截止日期
-                start_dates = [t.start_date for t in group_tasks if t.start_date]
-                due_dates = [t.due_date for t in group_tasks if t.due_date]
-                overall_start = min(start_dates) if start_dates else None
-                overall_due = max(due_dates) if due_dates else None
-
-                # 使用第一个任务的重要性
-                group_importance = group_tasks[0].importance if group_tasks else 1
-
-                # 移除描述中的序号
-                base_description = re.sub(r' \(\d+/\d+\)$', '', group_tasks[0].description)
-
-                # 检查所有子任务是否完成
-                all_completed = all(t.completed for t in group_tasks)
-
-                # 创建代表整个组的任务
-                group_task = Task(
-                    description=f"{base_description} (共{len(group_tasks)}个子任务)",
-                    start_date=overall_start,
-                    due_date=overall_due,
-                    completed=all_completed,
-                    group_id=task.group_id,
-                    is_multi=True,
-                    importance=group_importance
-                )
-                group_task.id = task.group_id  # 使用组ID作为标识
-                group_task.is_group_task = True  # 标记为组任务
+            group_tasks = groups.get(task.group_id)
+            if group_tasks is None:
+                # 首次遇到该组：先用占位列表记录位置，组内任务后续补齐
+                group_tasks = groups[task.group_id] = []
+                grouped_tasks.append(group_tasks)
+            group_tasks.append(task)
 
-                grouped_tasks.append(group_task)
-                seen_groups.add(task.group_id)  # 标记为已处理
+        # 将占位的组任务列表替换为代表任务
+        for i, entry in enumerate(grouped_tasks):
+            if not isinstance(entry, list):
+                continue
+            group_tasks = entry
+
+            # 一个循环同时算出起止日期范围和整体完成状态，只扫组内任务一遍
+            overall_start = None
+            overall_due = None
+            all_completed = True
+            for t in group_tasks:
+                if t.start_date and (overall_start is None or t.start_date < overall_start):
+                    overall_start = t.start_date
+                if t.due_date and (overall_due is None or t.due_date > overall_due):
+                    overall_due = t.due_date
+                all_completed &= t.completed
+
+            # 使用第一个任务的重要性
+            group_importance = group_tasks[0].importance
+
+            # 移除描述中的序号
+            base_description = _MULTI_SUFFIX_RE.sub('', group_tasks[0].description)
+
+            # 创建代表整个组的任务
+            group_task = Task(
+                description=f"{base_description} (共{len(group_tasks)}个子任务)",
+                start_date=overall_start,
+                due_date=overall_due,
+                completed=all_completed,
+                group_id=group_tasks[0].group_id,
+                is_multi=True,
+                importance=group_importance
+            )
+            group_task.id = group_tasks[0].group_id  # 使用组ID作为标识
+            group_task.is_group_task = True  # 标记为组任务
+            group_task.base_description = base_description  # 保留原始描述，界面无需再拆字符串
+            grouped_tasks[i] = group_task
 
         return grouped_tasks
 
 
 # 主应用程序类，实现GUI界面
 class TaskManagerApp:
+    # 重要性星级只有6种取值（0-5星），提前生成查表即可，不必每行拼接字符串
+    _IMPORTANCE_STARS = tuple("★" * i + "☆" * (5 - i) for i in range(6))
+
+    # 各列的排序键函数（类级定义一次，避免每次排序都重建dict和4个lambda）
+    _SORT_KEYS = {
+        'importance': attrgetter('importance'),  # C实现，无Python帧开销
+        'task_name': lambda t: t.description.lower(),
+        'start_date': lambda t: t.start_date or date.min,
+        'due_date': lambda t: t.due_date or date.min,
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title('JIANNAN Schedule')
@@ -287,6 +488,19 @@ class TaskManagerApp:
         # 初始化任务管理器
         self.manager = TaskManager()
         self.current_date = datetime.now()  # 当前显示日期
+        # 多任务组代表任务的缓存（group_id -> Task），任务变动时整体清空
+        self._group_rep_cache = {}
+
+        # 任务编辑对话框（首次打开时构建，之后复用）
+        self._task_dialog = None
+        self._dialog_task = None
+
+        # 搜索防抖状态
+        self._search_after_id = None  # 待执行的after回调ID
+        self._last_query = None  # 上次实际执行过的查询串
+        # 搜索索引：(小写文本, 任务) 列表，按任务数据版本号惰性重建
+        self._search_index = None
+        self._search_index_version = -1
 
         # 排序设置
         self.sort_column = 'importance'  # 默认按重要性排序
@@ -296,9 +510,17 @@ class TaskManagerApp:
         # 在 __init__ 中初始化 progress_var
         self.progress_var = tk.DoubleVar(value=0.0)
 
+        # 今天日期的缓存（60秒内复用，避免频繁的系统时间调用）
+        self._today_date = date.today()
+        self._today_ts = time.monotonic()
+
         # 计时器属性初始化
         self.timer_running = False
         self.elapsed_time = 0
+        self._start_mono = 0.0  # 计时起点（time.monotonic，不受系统时间调整影响）
+        self._last_sec = -1  # 上次显示的秒数，用于跳过无变化的标签刷新
+        self._last_progress = -1  # 上次设置的进度条整数值，同样用于跳过无变化刷新
+        self._goal_seconds = 25 * 60  # 缓存的学习目标（秒）
         self.study_records = []
         self.current_event_name = None  # 新增：当前学习事件名称
         self.load_study_records()  # 加载学习记录
@@ -309,6 +531,9 @@ class TaskManagerApp:
         # 设置自动保存（每30秒）
         self.root.after(30000, self.auto_save)
 
+        # 关闭窗口时先把未写出的保存落盘（后台写盘线程是daemon，直接退出会丢数据）
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # 初始显示今天的任务
         self.show_today_tasks()
 
@@ -337,11 +562,26 @@ class TaskManagerApp:
 
         window.geometry(f'+{x}+{y}')
 
-    # 自动保存方法
+    # 返回今天的日期（date对象，最多缓存60秒；记录的date字段同为date对象，可直接比较）
+    def _today(self):
+        now = time.monotonic()
+        if now - self._today_ts > 60:
+            self._today_date = date.today()
+            self._today_ts = now
+        return self._today_date
+
+    # 自动保存方法（任务无改动时跳过，避免每30秒重写整个文件）
     def auto_save(self):
-        self.manager.save_tasks()
+        if self.manager._dirty:
+            self.manager.save_tasks()
         self.root.after(30000, self.auto_save)  # 递归调用实现定时器
 
+    # 窗口关闭处理：确保最后的改动写入磁盘后再退出
+    def on_close(self):
+        self.manager.save_tasks()  # 还有未保存的改动则先入队
+        self.manager.flush_saves()
+        self.root.destroy()
+
     # 创建GUI组件
     def create_widgets(self):
         # 主框架
@@ -377,6 +617,10 @@ class TaskManagerApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.task_tree.pack(fill=tk.BOTH, expand=True)
 
+        # 标签样式只需配置一次（已完成灰色，未完成黑色），不必每次刷新都设置
+        self.task_tree.tag_configure("completed", foreground="gray")
+        self.task_tree.tag_configure("pending", foreground="black")
+
         # 事件绑定
         self.task_tree.bind("<<TreeviewSelect>>", self.on_task_select)
         self.task_tree.bind("<Double-1>", self.on_double_click)  # 双击编辑
@@ -462,8 +706,10 @@ class TaskManagerApp:
         self.record_label = ttk.Label(parent, text="0 次")
         self.record_label.grid(row=0, column=4, padx=(0, 10))
 
-        # 学习目标
+        # 学习目标（值变化时通过trace更新缓存的秒数，tick循环内不再读StringVar）
         self.goal_var = tk.StringVar(value="25")
+        self.goal_var.trace_add('write', lambda *_: self._refresh_goal_seconds())
+        self._refresh_goal_seconds()
         ttk.Label(parent, text="目标(分):").grid(row=0, column=5)
         goal_entry = ttk.Spinbox(parent, textvariable=self.goal_var, width=3, from_=5, to=120)
         goal_entry.grid(row=0, column=6, padx=5)
@@ -481,6 +727,13 @@ class TaskManagerApp:
         self.load_study_records()
         self.update_record_label()
 
+    # 解析学习目标并缓存为秒数（由goal_var的写入trace触发，避免每秒一次Tcl往返）
+    def _refresh_goal_seconds(self):
+        try:
+            self._goal_seconds = int(self.goal_var.get() or 25) * 60
+        except ValueError:
+            self._goal_seconds = 25 * 60
+
     def toggle_timer(self):
         if not self.timer_running:
             # 弹出对话框让用户输入学习事件名称
@@ -488,18 +741,19 @@ class TaskManagerApp:
             if event_name is None:  # 用户取消了输入
                 return
 
-            # 开始计时
+            # 开始计时（monotonic时钟只需一次浮点读数，每秒tick不再构造datetime对象）
             self.timer_running = True
             self.current_event_name = event_name  # 保存当前学习事件名称
             self.timer_button.config(text="停止学习")
-            self.start_time = datetime.now()
+            self._start_mono = time.monotonic()
+            self._last_sec = -1
+            self._last_progress = -1
             self.update_timer()
         else:
             # 停止计时
             self.timer_running = False
             self.timer_button.config(text="开始学习")
-            end_time = datetime.now()
-            duration = (end_time - self.start_time).total_seconds()
+            duration = time.monotonic() - self._start_mono
             self.record_study_session(duration, self.current_event_name)
             self.current_event_name = None  # 清空当前事件名称
 
@@ -542,33 +796,47 @@ class TaskManagerApp:
         # 记录学习会话
         record = {
             "id": str(uuid.uuid4()),  # 添加唯一ID
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": self._today(),
             "duration": duration_seconds,
             "event_name": event_name  # 保存事件名称
         }
         self.study_records.append(record)
+        self._records_by_id[record["id"]] = record
+        # 增量维护聚合值
+        self._total_study_seconds += duration_seconds
+        self._sessions_by_date[record["date"]] += 1
+        self._seconds_by_date[record["date"]] += duration_seconds
         self.save_study_records()
         self.update_record_label()
 
     def update_timer(self):
         if self.timer_running:
-            elapsed = (datetime.now() - self.start_time).total_seconds() + self.elapsed_time
-            hours, remainder = divmod(int(elapsed), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            self.timer_label.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            elapsed = time.monotonic() - self._start_mono + self.elapsed_time
+            secs = int(elapsed)
+            # 只有显示的秒数前进时才重设标签文本，省掉无效的控件重绘
+            if secs != self._last_sec:
+                self._last_sec = secs
+                hours, remainder = divmod(secs, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                self.timer_label.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
-            # 更新进度条
-            goal_minutes = int(self.goal_var.get() or 25)
-            progress = min(100.0, (elapsed / (goal_minutes * 60)) * 100)
-            self.progress_var.set(progress)
+            # 更新进度条（目标秒数已缓存），整数百分比没变时不触碰Tcl变量
+            progress = min(100.0, (elapsed / self._goal_seconds) * 100)
+            if int(progress) != self._last_progress:
+                self._last_progress = int(progress)
+                self.progress_var.set(progress)
 
-            self.root.after(1000, self.update_timer)
+            # 对齐到下一个整秒边界，显示的秒数不会跳帧或迟滞
+            delay = 1000 - int((elapsed % 1.0) * 1000)
+            self.root.after(delay or 1000, self.update_timer)
 
 
 
     def reset_timer(self):
         self.timer_running = False
         self.elapsed_time = 0
+        self._last_sec = -1
+        self._last_progress = -1
         self.timer_label.config(text="00:00:00")
         self.progress_var.set(0.0)
         self.timer_button.config(text="开始学习")
@@ -576,13 +844,26 @@ class TaskManagerApp:
     def load_study_records(self):
         if os.path.exists('study_records.json'):
             try:
-                with open('study_records.json', 'r') as f:
-                    records = json.load(f)
-                    # 确保每条记录都有唯一ID
+                with open('study_records.json', 'rb') as f:
+                    records = _json_loads(f.read())
+                    # 确保每条记录都有唯一ID，并把日期字符串解析为date对象
+                    # （内存中统一用date，统计比较不再逐条做字符串格式化）
+                    # 逐条处理日期：单条解析失败不能连累整个文件清空
+                    parsed = []
                     for record in records:
                         if 'id' not in record:
                             record['id'] = str(uuid.uuid4())
-                    self.study_records = records
+                        if isinstance(record["date"], str):
+                            try:
+                                record["date"] = _parse_date(record["date"])
+                            except ValueError:
+                                # 旧版本写入的未补零日期（如"2026-1-5"）用strptime兜底
+                                try:
+                                    record["date"] = datetime.strptime(record["date"], "%Y-%m-%d").date()
+                                except ValueError:
+                                    continue  # 彻底无法解析的日期只跳过这一条
+                        parsed.append(record)
+                    self.study_records = parsed
                     # 保存更新后的记录（确保ID被保存）
                     self.save_study_records()
             except:
@@ -590,18 +871,28 @@ class TaskManagerApp:
         else:
             self.study_records = []
 
+        # 一次遍历建立运行中的聚合值，之后增删记录时增量维护，标签刷新变为O(1)
+        # （map+itemgetter让求和循环完全在C层执行，不为每条记录进Python帧）
+        self._total_study_seconds = sum(map(_get_duration, self.study_records))
+        self._sessions_by_date = Counter(r["date"] for r in self.study_records)
+        self._seconds_by_date = Counter()
+        for r in self.study_records:
+            self._seconds_by_date[r["date"]] += r["duration"]
+        # id->记录 映射，编辑/删除时直接查表而不是线性查找
+        self._records_by_id = {r["id"]: r for r in self.study_records}
+
     def save_study_records(self):
-        with open('study_records.json', 'w') as f:
-            json.dump(self.study_records, f, indent=2)
+        # 与任务保存相同的原子写入方式
+        with open('study_records.json.tmp', 'wb') as f:
+            f.write(_json_dumps(self.study_records))
+        os.replace('study_records.json.tmp', 'study_records.json')
 
 
     def update_record_label(self):
-        # 计算今日学习次数
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_sessions = sum(1 for r in self.study_records if r["date"] == today)
-
-        # 计算总学习时间（分钟）
-        total_minutes = sum(r["duration"] for r in self.study_records) // 60
+        # 直接读取增量维护的聚合值，无需遍历全部记录
+        today = self._today()
+        today_sessions = self._sessions_by_date[today]
+        total_minutes = self._total_study_seconds // 60
 
         self.record_label.config(text=f"今日: {today_sessions} 次 | 总计: {total_minutes} 分钟")
 
@@ -646,16 +937,26 @@ class TaskManagerApp:
         # 配置滚动条
         scrollbar.config(command=tree.yview)
 
-        # 添加数据
-        for record in self.study_records:
-            minutes = round(record["duration"] / 60, 1)
-            tree.insert("", "end", values=(
-                record["id"],
-                record["date"],
-                record.get("event_name", "未命名"),
-                int(record["duration"]),
-                minutes
-            ))
+        # 分批插入数据，批次之间交还Tk事件循环，几千条记录也不会卡住窗口
+        records = list(self.study_records)
+        chunk_size = 200
+
+        def insert_chunk(start=0):
+            if not tree.winfo_exists():
+                return  # 窗口已关闭，停止填充
+            for record in records[start:start + chunk_size]:
+                minutes = round(record["duration"] / 60, 1)
+                tree.insert("", "end", values=(
+                    record["id"],
+                    record["date"].isoformat(),
+                    record.get("event_name", "未命名"),
+                    int(record["duration"]),
+                    minutes
+                ))
+            if start + chunk_size < len(records):
+                detail_window.after(1, insert_chunk, start + chunk_size)
+
+        insert_chunk()
 
         # 添加编辑和删除按钮
         button_frame = ttk.Frame(detail_window)
@@ -670,19 +971,15 @@ class TaskManagerApp:
         stats_frame = ttk.Frame(detail_window)
         stats_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        # 计算统计数据
-        total_duration = sum(r["duration"] for r in self.study_records)
-        total_minutes = total_duration / 60
+        # 统计数据直接读取增量维护的聚合值
+        today = self._today()
+        total_minutes = self._total_study_seconds / 60
         total_hours = total_minutes / 60
-
-        # 今日数据
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_records = [r for r in self.study_records if r["date"] == today]
-        today_duration = sum(r["duration"] for r in today_records)
-        today_minutes = today_duration / 60
+        today_count = self._sessions_by_date[today]
+        today_minutes = self._seconds_by_date[today] / 60
 
         # 创建统计变量
-        self.today_count_var = tk.StringVar(value=f"今日学习: {len(today_records)}次, {round(today_minutes, 1)}分钟")
+        self.today_count_var = tk.StringVar(value=f"今日学习: {today_count}次, {round(today_minutes, 1)}分钟")
         self.total_count_var = tk.StringVar(value=f"总学习次数: {len(self.study_records)}")
         self.total_time_var = tk.StringVar(
             value=f"总学习时间: {round(total_hours, 1)}小时 ({round(total_minutes, 1)}分钟)")
@@ -718,12 +1015,8 @@ class TaskManagerApp:
         # 居中显示
         self.center_window(edit_dialog, parent_window)
 
-        # 查找要编辑的记录
-        record_to_edit = None
-        for record in self.study_records:
-            if record['id'] == record_id:
-                record_to_edit = record
-                break
+        # 查找要编辑的记录（O(1)查表）
+        record_to_edit = self._records_by_id.get(record_id)
 
         if not record_to_edit:
             messagebox.showerror("错误", "未找到记录")
@@ -732,7 +1025,7 @@ class TaskManagerApp:
 
         # 创建表单
         ttk.Label(edit_dialog, text="日期 (YYYY-MM-DD):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        date_var = tk.StringVar(value=record_to_edit["date"])
+        date_var = tk.StringVar(value=record_to_edit["date"].isoformat())
         date_entry = ttk.Entry(edit_dialog, textvariable=date_var, width=15)
         date_entry.grid(row=0, column=1, padx=5, pady=5)
 
@@ -758,11 +1051,18 @@ class TaskManagerApp:
                     messagebox.showwarning("警告", "日期和事件名称不能为空")
                     return
 
-                # 验证日期格式
-                datetime.strptime(new_date, "%Y-%m-%d")
+                # 验证并解析日期
+                new_date_obj = _parse_date(new_date)
+
+                # 调整聚合值：扣除旧值并计入新值
+                self._total_study_seconds += int(new_minutes * 60) - record_to_edit["duration"]
+                self._sessions_by_date[record_to_edit["date"]] -= 1
+                self._sessions_by_date[new_date_obj] += 1
+                self._seconds_by_date[record_to_edit["date"]] -= record_to_edit["duration"]
+                self._seconds_by_date[new_date_obj] += int(new_minutes * 60)
 
                 # 更新记录
-                record_to_edit["date"] = new_date
+                record_to_edit["date"] = new_date_obj
                 record_to_edit["event_name"] = new_event
                 record_to_edit["duration"] = int(new_minutes * 60)  # 转换为秒
 
@@ -809,43 +1109,42 @@ class TaskManagerApp:
         values = tree.item(item, "values")
         record_id = values[0]  # 第一列现在是ID
 
-        # 找到并删除记录
-        for i, record in enumerate(self.study_records):
-            if record["id"] == record_id:
-                # 删除记录
-                del self.study_records[i]
-
-                # 保存到文件
-                self.save_study_records()
+        # 通过映射直接定位记录
+        record = self._records_by_id.pop(record_id, None)
+        if record is None:
+            messagebox.showerror("错误", "未找到记录")
+            return
 
-                # 从树状视图中删除
-                tree.delete(item)
+        # 删除记录并回退聚合值
+        self.study_records.remove(record)
+        self._total_study_seconds -= record["duration"]
+        self._sessions_by_date[record["date"]] -= 1
+        self._seconds_by_date[record["date"]] -= record["duration"]
 
-                # 更新统计信息
-                self.update_statistics(parent_window)
+        # 保存到文件
+        self.save_study_records()
 
-                # 更新主窗口的统计标签
-                self.update_record_label()
+        # 从树状视图中删除
+        tree.delete(item)
 
-                return
+        # 更新统计信息
+        self.update_statistics(parent_window)
 
-        messagebox.showerror("错误", "未找到记录")
+        # 更新主窗口的统计标签
+        self.update_record_label()
 
     def update_statistics(self, parent_window):
-        """更新统计信息"""
-        # 计算统计数据
-        total_duration = sum(r["duration"] for r in self.study_records)
-        total_minutes = total_duration / 60
+        """更新统计信息（读取增量维护的聚合值，不再扫描全部记录）"""
+        total_minutes = self._total_study_seconds / 60
         total_hours = total_minutes / 60
 
         # 今日数据
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_records = [r for r in self.study_records if r["date"] == today]
-        today_duration = sum(r["duration"] for r in today_records)
-        today_minutes = today_duration / 60
+        today = self._today()
+        today_count = self._sessions_by_date[today]
+        today_minutes = self._seconds_by_date[today] / 60
 
         # 更新统计变量
-        self.today_count_var.set(f"今日学习: {len(today_records)}次, {round(today_minutes, 1)}分钟")
+        self.today_count_var.set(f"今日学习: {today_count}次, {round(today_minutes, 1)}分钟")
         self.total_count_var.set(f"总学习次数: {len(self.study_records)}")
         self.total_time_var.set(f"总学习时间: {round(total_hours, 1)}小时 ({round(total_minutes, 1)}分钟)")
 
@@ -861,16 +1160,13 @@ class TaskManagerApp:
             self.sort_reverse = False
         self.sort_column = column
 
-        # 定义排序键
-        key_map = {
-            'importance': lambda t: t.importance,
-            'task_name': lambda t: t.description.lower(),
-            'start_date': lambda t: t.start_date or date.min,
-            'due_date': lambda t: t.due_date or date.min
-        }
-        key = key_map[column]
-        sorted_list = sorted(self.displayed_tasks, key=key, reverse=self.sort_reverse)
-        self.display_tasks(sorted_list)  # 显示排序后任务
+        key = self._SORT_KEYS[column]
+        tasks = self.displayed_tasks
+        # 每个任务只计算一次排序键，然后按键排序下标
+        # （避免sorted在比较过程中反复调用key函数和lower()）
+        keys = [key(t) for t in tasks]
+        order = sorted(range(len(tasks)), key=keys.__getitem__, reverse=self.sort_reverse)
+        self.display_tasks([tasks[i] for i in order])  # 显示排序后任务
 
     # 更新日期标签
     def update_date_label(self):
@@ -900,21 +1196,21 @@ class TaskManagerApp:
     def show_today_tasks(self):
         self.current_date = datetime.now()
         self.update_date_label()
-        self.display_tasks(self.manager.get_today_tasks())
+        self.display_tasks(self.manager.get_today_tasks(), assume_unique=True)
         self.cal.selection_set(self.current_date.date())  # 高亮日历中的今天
 
     # 显示前一天任务
     def show_previous_day(self):
         self.current_date -= timedelta(days=1)
         self.update_date_label()
-        self.display_tasks(self.manager.get_tasks_by_date(self.current_date))
+        self.display_tasks(self.manager.get_tasks_by_date(self.current_date), assume_unique=True)
         self.cal.selection_set(self.current_date.date())
 
     # 显示后一天任务
     def show_next_day(self):
         self.current_date += timedelta(days=1)
         self.update_date_label()
-        self.display_tasks(self.manager.get_tasks_by_date(self.current_date))
+        self.display_tasks(self.manager.get_tasks_by_date(self.current_date), assume_unique=True)
         self.cal.selection_set(self.current_date.date())
 
     # 日历选择事件处理
@@ -922,57 +1218,66 @@ class TaskManagerApp:
         selected_date = self.cal.selection_get()
         self.current_date = datetime.combine(selected_date, datetime.min.time())
         self.update_date_label()
-        self.display_tasks(self.manager.get_tasks_by_date(self.current_date))
+        self.display_tasks(self.manager.get_tasks_by_date(self.current_date), assume_unique=True)
 
     # 在界面中显示任务列表
-    def display_tasks(self, tasks):
+    # assume_unique=True 表示调用方保证tasks无重复（如get_tasks_by_date的结果），可跳过去重
+    def display_tasks(self, tasks, assume_unique=False):
         # 清空当前显示
         self.task_tree.delete(*self.task_tree.get_children())
 
         # 任务去重（防止重复显示）
-        unique = {t.id: t for t in tasks}
-        deduped_tasks = list(unique.values())
+        if assume_unique:
+            deduped_tasks = list(tasks)
+        else:
+            deduped_tasks = list({t.id: t for t in tasks}.values())
         self.displayed_tasks = deduped_tasks
 
         # 应用当前排序
         if self.sort_column:
-            key_map = {
-                'importance': lambda t: t.importance,
-                'task_name': lambda t: t.description.lower(),
-                'start_date': lambda t: t.start_date or date.min,
-                'due_date': lambda t: t.due_date or date.min
-            }
-            key = key_map[self.sort_column]
-            deduped_tasks = sorted(deduped_tasks, key=key, reverse=self.sort_reverse)
-
-        # 添加任务到树状视图
+            key = self._SORT_KEYS[self.sort_column]
+            # 同样先批量算好排序键，再排序下标
+            keys = [key(t) for t in deduped_tasks]
+            order = sorted(range(len(deduped_tasks)), key=keys.__getitem__,
+                           reverse=self.sort_reverse)
+            deduped_tasks = [deduped_tasks[i] for i in order]
+
+        # 先在Python侧构建好所有行数据，再批量插入，减少刷新期间的布局/重绘开销
+        # 循环外把常用对象绑定成局部变量，循环体内全部走LOAD_FAST而不是属性查找
+        rows = []
+        append = rows.append
+        stars = self._IMPORTANCE_STARS  # 重要性星级查找表
         for task in deduped_tasks:
-            # 确定任务描述显示方式
-            if hasattr(task, 'is_group_task'):
-                display_desc = task.description  # 组任务
-            elif task.is_multi:
-                display_desc = task.description  # 多任务组中的单个任务
-            else:
-                display_desc = task.description  # 普通任务
-
-            # 格式化日期
-            start = task.start_date.strftime("%Y-%m-%d") if task.start_date else "无起始日期"
-            due = task.due_date.strftime("%Y-%m-%d") if task.due_date else "无截止日期"
-            status = "已完成" if task.completed else "未完成"
-
-            # 用星号表示重要性（★ = 已选，☆ = 未选）
-            importance_stars = "★" * task.importance + "☆" * (5 - task.importance)
-
-            # 插入到树状视图
-            self.task_tree.insert(
-                "", "end", iid=task.id,
-                values=(importance_stars, display_desc, start, due, status),
-                tags=("completed" if task.completed else "pending",)
-            )
-
-        # 设置标签样式（已完成灰色，未完成黑色）
-        self.task_tree.tag_configure("completed", foreground="gray")
-        self.task_tree.tag_configure("pending", foreground="black")
+            completed = task.completed
+            # 组任务的描述在构建代表任务时就已带上后缀，这里统一直接取；
+            # 日期字符串读任务上的缓存，不再每行strftime
+            append((task.id,
+                    (stars[task.importance], task.description,
+                     task.start_date_str or "无起始日期",
+                     task.due_date_str or "无截止日期",
+                     "已完成" if completed else "未完成"),
+                    ("completed" if completed else "pending",)))
+
+        # 紧凑循环插入（绑定insert方法，避免每行一次属性查找），最后统一刷新
+        insert = self.task_tree.insert
+        for iid, values, tags in rows:
+            insert("", "end", iid=iid, values=values, tags=tags)
+        self.task_tree.update_idletasks()
+
+    # 原地更新单行显示（状态切换等只影响一行时，避免整表重建）
+    # 行不在当前视图中时返回False，由调用方决定是否整体刷新
+    def _update_task_row(self, task):
+        tree = self.task_tree
+        if not tree.exists(task.id):
+            return False
+
+        status = "已完成" if task.completed else "未完成"
+        tree.item(task.id,
+                  values=(self._IMPORTANCE_STARS[task.importance], task.description,
+                          task.start_date_str or "无起始日期",
+                          task.due_date_str or "无截止日期", status),
+                  tags=("completed" if task.completed else "pending",))
+        return True
 
     # 显示所有任务（分组显示）
     def show_all_tasks(self):
@@ -981,16 +1286,32 @@ class TaskManagerApp:
         self.display_tasks(grouped_tasks)
         self.update_date_label()
 
-    # 任务搜索功能
+    # 任务搜索入口：延迟180ms执行并取消未触发的旧调度，连续击键只刷新一次
     def search_tasks(self, event=None):
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(180, self._do_search)
+
+    # 实际执行搜索
+    def _do_search(self):
+        self._search_after_id = None
         query = self.search_var.get().lower()
+        if query == self._last_query:
+            return  # 查询内容没变（如方向键），跳过整个刷新
+        self._last_query = query
+
         if not query:
             self.show_today_tasks()  # 空搜索显示今天任务
             return
 
-        # 过滤匹配任务
-        results = [task for task in self.manager.tasks
-                   if query in task.description.lower()]
+        # 任务数据版本变化时才重建索引，平时搜索只扫已准备好的字符串列表
+        manager = self.manager
+        if self._search_index is None or self._search_index_version != manager._version:
+            self._search_index = [(t.search_blob, t) for t in manager.tasks]
+            self._search_index_version = manager._version
+
+        # 过滤匹配任务（纯字符串in判断，无属性查找开销）
+        results = [task for blob, task in self._search_index if query in blob]
         self.display_tasks(results)
         self.date_label.config(text=f"搜索: '{query}' (找到{len(results)}个任务)")
 
@@ -1006,24 +1327,29 @@ class TaskManagerApp:
             if task.id == task_id:
                 return task
 
-        # 如果未找到，再检查原始任务列表
-        for task in self.manager.tasks:
-            if task.id == task_id:
-                # 多任务子任务返回组代表
-                if task.is_multi:
-                    return self.get_group_representative(task.group_id)
-                return task
+        # 如果未找到，再查任务管理器的id索引
+        task = self.manager._by_id.get(task_id)
+        if task is not None:
+            # 多任务子任务返回组代表
+            if task.is_multi:
+                return self.get_group_representative(task.group_id)
+            return task
 
         return None
 
-    # 获取多任务组的代表任务
+    # 获取多任务组的代表任务（结果按group_id缓存，任务变动时清空）
     def get_group_representative(self, group_id):
-        group_tasks = [t for t in self.manager.tasks if t.group_id == group_id]
+        cached = self._group_rep_cache.get(group_id)
+        if cached is not None:
+            return cached
+
+        # 直接查管理器的分组索引，不再线性扫描全部任务
+        group_tasks = self.manager._by_group.get(group_id)
         if not group_tasks:
             return None
 
-        # 提取基础描述（移除序号）
-        base_description = re.sub(r' \(\d+/\d+\)$', '', group_tasks[0].description)
+        # 提取基础描述（移除序号，使用模块级预编译的正则）
+        base_description = _MULTI_SUFFIX_RE.sub('', group_tasks[0].description)
 
         # 创建代表任务
         group_task = Task(
@@ -1037,8 +1363,10 @@ class TaskManagerApp:
         )
         group_task.id = group_id  # 使用组ID作为标识
         group_task.is_group_task = True  # 标记为组任务
+        group_task.base_description = base_description  # 保留原始描述，界面无需再拆字符串
         group_task.created_at = min(t.created_at for t in group_tasks)  # 添加创建时间
 
+        self._group_rep_cache[group_id] = group_task
         return group_task
 
     # 任务选择事件（当前无操作）
@@ -1062,53 +1390,79 @@ class TaskManagerApp:
             messagebox.showwarning("警告", "请先选择一个任务")
 
     # 打开任务编辑对话框
-    # 打开任务编辑对话框
+    # 控件只在首次调用时构建（创建Tk控件开销大），之后复用同一个对话框，仅重置输入值
     def open_task_dialog(self, task=None):
-        dialog = tk.Toplevel(self.root)
+        self._dialog_task = task  # 当前正在编辑的任务（None表示新增）
+
+        if self._task_dialog is None or not self._task_dialog.winfo_exists():
+            self._build_task_dialog()
+
+        dialog = self._task_dialog
         dialog.title("编辑任务" if task else "添加任务")
-        dialog.transient(self.root)
-        dialog.grab_set()  # 模态对话框
 
-        # 居中显示
+        # 重置任务描述（多任务组代表任务直接读保存好的原始描述）
+        if task and task.is_group_task:
+            self._dialog_description_var.set(task.base_description)
+        else:
+            self._dialog_description_var.set(task.description if task else "")
+
+        # 重置任务详情
+        self._dialog_details_text.delete("1.0", tk.END)
+        if task and task.details:
+            self._dialog_details_text.insert("1.0", task.details)
+
+        # 重置日期输入（读任务上缓存的日期字符串，无日期时为空串）
+        self._dialog_start_var.set(self._today().isoformat())
+        self._dialog_due_var.set("")
+        if task:
+            if task.start_date:
+                self._dialog_start_var.set(task.start_date_str)
+            if task.due_date:
+                self._dialog_due_var.set(task.due_date_str)
+
+        # 重置任务模式和重要性
+        self._dialog_mode_var.set(2 if task and task.is_multi else 1)
+        self._dialog_importance_var.set(task.importance if task else 1)
+
+        # 显示对话框
+        dialog.deiconify()
+        dialog.grab_set()  # 模态对话框
         self.center_window(dialog, self.root)
+        self._dialog_description_entry.focus()
+
+    # 构建任务编辑对话框的全部控件（只执行一次）
+    def _build_task_dialog(self):
+        dialog = self._task_dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.transient(self.root)
+        # 点窗口关闭按钮时隐藏而不是销毁，控件留待复用
+        dialog.protocol("WM_DELETE_WINDOW", self._close_task_dialog)
 
         # 任务描述输入
         ttk.Label(dialog, text="任务描述:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self._dialog_description_var = tk.StringVar()
+        self._dialog_description_entry = ttk.Entry(dialog, textvariable=self._dialog_description_var, width=40)
+        self._dialog_description_entry.grid(row=0, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W)
 
-        # 如果是多任务组代表任务，去除后缀
-        if task and hasattr(task, 'is_group_task'):
-            base_description = task.description.split(' (共')[0]  # 去除后缀
-            description_var = tk.StringVar(value=base_description)
-        else:
-            description_var = tk.StringVar(value=task.description if task else "")
-
-        description_entry = ttk.Entry(dialog, textvariable=description_var, width=40)
-        description_entry.grid(row=0, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W)
-        description_entry.focus()
-
-        # 任务详情输入 - 新增部分
+        # 任务详情输入
         ttk.Label(dialog, text="任务详情:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.NW)
-        details_text = tk.Text(dialog, width=40, height=5)
-        details_text.grid(row=1, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W)
-
-        # 如果有任务详情，填充到文本框中
-        if task and task.details:
-            details_text.insert("1.0", task.details)
+        self._dialog_details_text = tk.Text(dialog, width=40, height=5)
+        self._dialog_details_text.grid(row=1, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W)
 
         # 起始日期输入
         ttk.Label(dialog, text="起始日期:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
-        start_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
-        start_date_entry = ttk.Entry(dialog, textvariable=start_date_var, width=15)
+        self._dialog_start_var = tk.StringVar()
+        start_date_entry = ttk.Entry(dialog, textvariable=self._dialog_start_var, width=15)
         start_date_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
 
         # 截止日期输入
         ttk.Label(dialog, text="截止日期:").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
-        due_date_var = tk.StringVar()
-        due_date_entry = ttk.Entry(dialog, textvariable=due_date_var, width=15)
+        self._dialog_due_var = tk.StringVar()
+        due_date_entry = ttk.Entry(dialog, textvariable=self._dialog_due_var, width=15)
         due_date_entry.grid(row=3, column=1, padx=5, pady=5, sticky=tk.W)
 
         # 日期选择器辅助函数
-        def open_calendar(entry_var, row, parent):
+        def open_calendar(entry_var):
             cal_dialog = tk.Toplevel(dialog)
             cal_dialog.title("选择日期")
             cal = Calendar(cal_dialog, selectmode="day", date_pattern="y-mm-dd")
@@ -1119,44 +1473,35 @@ class TaskManagerApp:
                 cal_dialog.destroy()
 
             ttk.Button(cal_dialog, text="确定", command=set_date).pack(pady=5)
-            self.center_window(cal_dialog, parent)
+            self.center_window(cal_dialog, dialog)
 
         # 起始日期选择按钮
         ttk.Button(dialog, text="选择",
-                   command=lambda: open_calendar(start_date_var, 2, dialog)).grid(
+                   command=lambda: open_calendar(self._dialog_start_var)).grid(
             row=2, column=2, padx=5, pady=5, sticky=tk.W)
 
         # 截止日期选择按钮
         ttk.Button(dialog, text="选择",
-                   command=lambda: open_calendar(due_date_var, 3, dialog)).grid(
+                   command=lambda: open_calendar(self._dialog_due_var)).grid(
             row=3, column=2, padx=5, pady=5, sticky=tk.W)
 
-        # 设置编辑时的日期值
-        if task:
-            if task.start_date:
-                start_date_var.set(task.start_date.strftime("%Y-%m-%d"))
-            if task.due_date:
-                due_date_var.set(task.due_date.strftime("%Y-%m-%d"))
-
         # 任务模式选择（单任务/多任务）
-        task_mode = tk.IntVar(value=1)  # 1=单任务, 2=多任务
-        if task:
-            task_mode.set(2 if task.is_multi else 1)
-        else:
-            task_mode.set(1)
+        self._dialog_mode_var = tk.IntVar(value=1)  # 1=单任务, 2=多任务
 
         # 模式选择框架
         mode_frame = ttk.Frame(dialog)
         mode_frame.grid(row=4, column=0, columnspan=4, padx=5, pady=5, sticky=tk.W)
 
         ttk.Label(mode_frame, text="任务模式:").pack(side=tk.LEFT)
-        ttk.Radiobutton(mode_frame, text="单个任务（起止日期）", variable=task_mode, value=1).pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(mode_frame, text="多个任务（每天一个）", variable=task_mode, value=2).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(mode_frame, text="单个任务（起止日期）",
+                        variable=self._dialog_mode_var, value=1).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(mode_frame, text="多个任务（每天一个）",
+                        variable=self._dialog_mode_var, value=2).pack(side=tk.LEFT, padx=5)
 
         # 重要性选择
         ttk.Label(dialog, text="重要性:").grid(row=5, column=0, padx=5, pady=5, sticky=tk.W)
-        importance_var = tk.IntVar(value=task.importance if task else 1)
-        importance_combo = ttk.Combobox(dialog, textvariable=importance_var, width=8)
+        self._dialog_importance_var = tk.IntVar(value=1)
+        importance_combo = ttk.Combobox(dialog, textvariable=self._dialog_importance_var, width=8)
         importance_combo['values'] = [1, 2, 3, 4, 5]
         importance_combo.state(['readonly'])  # 防止输入
         importance_combo.grid(row=5, column=1, padx=5, pady=5, sticky=tk.W)
@@ -1166,86 +1511,108 @@ class TaskManagerApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=6, column=0, columnspan=4, pady=10)
 
-        # 保存任务逻辑
-        def save_task():
-            # 验证输入
-            description = description_var.get().strip()
-            if not description:
-                messagebox.showwarning("警告", "任务描述不能为空")
-                return
-
-            # 获取任务详情
-            details = details_text.get("1.0", tk.END).strip()
+        # 对话框按钮
+        ttk.Button(btn_frame, text="保存", command=self._save_task_dialog).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="取消", command=self._close_task_dialog).pack(side=tk.LEFT, padx=5)
+
+    # 隐藏任务对话框（控件保留，下次打开直接复用）
+    def _close_task_dialog(self):
+        self._task_dialog.grab_release()
+        self._task_dialog.withdraw()
+
+    # 任务对话框的保存逻辑
+    def _save_task_dialog(self):
+        task = self._dialog_task
+
+        # 验证输入
+        description = self._dialog_description_var.get().strip()
+        if not description:
+            messagebox.showwarning("警告", "任务描述不能为空")
+            return
 
-            # 解析日期
-            start_date = datetime.strptime(start_date_var.get(), "%Y-%m-%d") if start_date_var.get().strip() else None
-            due_date = datetime.strptime(due_date_var.get(), "%Y-%m-%d") if due_date_var.get().strip() else None
+        # 获取任务详情
+        details = self._dialog_details_text.get("1.0", tk.END).strip()
 
-            importance = importance_var.get()
-            if not 1 <= importance <= 5:
-                messagebox.showwarning("警告", "重要性必须是1-5之间的整数")
-                return
+        # 解析日期（直接得到date对象，后续不用再调.date()转换）
+        # fromisoformat只接受补零的YYYY-MM-DD，手输的"2026-1-5"会抛ValueError
+        start_str = self._dialog_start_var.get().strip()
+        due_str = self._dialog_due_var.get().strip()
+        try:
+            start_date = _parse_date(start_str) if start_str else None
+            due_date = _parse_date(due_str) if due_str else None
+        except ValueError:
+            messagebox.showwarning("警告", "请输入有效的日期格式(YYYY-MM-DD)")
+            return
 
-            # 验证日期逻辑
-            if start_date and due_date and start_date > due_date:
-                messagebox.showwarning("警告", "起始日期不能晚于截止日期")
-                return
+        importance = self._dialog_importance_var.get()
+        if not 1 <= importance <= 5:
+            messagebox.showwarning("警告", "重要性必须是1-5之间的整数")
+            return
 
-            # 处理多任务模式
-            if task_mode.get() == 2:  # 多任务
-                if not start_date or not due_date:
-                    messagebox.showwarning("警告", "在多个任务模式下，起始日期和截止日期都不能为空")
-                    return
+        # 验证日期逻辑
+        if start_date and due_date and start_date > due_date:
+            messagebox.showwarning("警告", "起始日期不能晚于截止日期")
+            return
 
-                if (due_date - start_date).days < 0:
-                    messagebox.showwarning("警告", "截止日期不能早于起始日期")
-                    return
+        # 处理多任务模式
+        if self._dialog_mode_var.get() == 2:  # 多任务
+            if not start_date or not due_date:
+                messagebox.showwarning("警告", "在多个任务模式下，起始日期和截止日期都不能为空")
+                return
 
-                # 编辑时删除原组任务
-                if task:
-                    # 获取组ID（组任务或子任务）
-                    delete_group_id = task.group_id if task.group_id else task.id
-                    # 删除组内所有任务
-                    for t in [t for t in self.manager.tasks if t.group_id == delete_group_id]:
-                        self.manager.delete_task(t.id)
+            if (due_date - start_date).days < 0:
+                messagebox.showwarning("警告", "截止日期不能早于起始日期")
+                return
 
-                # 添加新多任务组
-                self.manager.add_multiple_tasks(
-                    description,
-                    start_date.date(),
-                    due_date.date(),
-                    importance,
-                    details
-                )
-            else:  # 单任务模式
-                if task:
+            # 编辑时删除原组任务
+            if task:
+                # 获取组ID（组任务或子任务）
+                delete_group_id = task.group_id if task.group_id else task.id
+                # 一次性删除组内所有任务（通过group索引收集）
+                self.manager.delete_tasks(
+                    [t.id for t in self.manager._by_group.get(delete_group_id, ())])
+
+            # 添加新多任务组
+            self.manager.add_multiple_tasks(
+                description,
+                start_date,
+                due_date,
+                importance,
+                details
+            )
+        else:  # 单任务模式
+            if task:
+                # 用户没改任何内容就点了保存：跳过写盘
+                changed = (task.description != description or task.details != details
+                           or task.start_date != start_date or task.due_date != due_date
+                           or task.is_multi or task.multi_index is not None
+                           or task.multi_total is not None or task.importance != importance)
+                if changed:
                     # 更新现有任务
                     task.description = description
                     task.details = details
-                    task.start_date = start_date.date() if start_date else None
-                    task.due_date = due_date.date() if due_date else None
+                    task.start_date = start_date
+                    task.due_date = due_date
                     task.is_multi = False
                     task.multi_index = None
                     task.multi_total = None
                     task.importance = importance
+                    self.manager._dirty = True  # 直接改了任务属性，标记待保存
                     self.manager.save_tasks()
-                else:
-                    # 添加新任务
-                    self.manager.add_task(
-                        description,
-                        start_date.date() if start_date else None,
-                        due_date.date() if due_date else None,
-                        importance=importance,
-                        details=details
-                    )
-
-            # 刷新显示并关闭对话框
-            self.display_tasks(self.manager.get_tasks_by_date(self.current_date))
-            dialog.destroy()
+            else:
+                # 添加新任务
+                self.manager.add_task(
+                    description,
+                    start_date,
+                    due_date,
+                    importance=importance,
+                    details=details
+                )
 
-        # 对话框按钮
-        ttk.Button(btn_frame, text="保存", command=save_task).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="取消", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        # 刷新显示并关闭对话框
+        self._group_rep_cache.clear()  # 任务已变动，缓存的代表任务失效
+        self.display_tasks(self.manager.get_tasks_by_date(self.current_date), assume_unique=True)
+        self._close_task_dialog()
     # 切换任务完成状态
     def toggle_completion(self):
         selected = self.task_tree.selection()
@@ -1257,9 +1624,9 @@ class TaskManagerApp:
         task = self.get_selected_task()
 
         # 处理组任务
-        if task and hasattr(task, 'is_group_task'):
-            # 获取组内所有任务
-            group_tasks = [t for t in self.manager.tasks if t.group_id == task.group_id]
+        if task and task.is_group_task:
+            # 获取组内所有任务（通过group索引，无需扫描全表）
+            group_tasks = self.manager._by_group.get(task.group_id, [])
 
             # 确定新的完成状态（取反）
             new_completed_state = not all(t.completed for t in group_tasks)
@@ -1267,14 +1634,22 @@ class TaskManagerApp:
             # 更新所有子任务
             for t in group_tasks:
                 t.completed = new_completed_state
+            task.completed = new_completed_state  # 同步组代表任务，供原地刷新使用
+            self.manager._dirty = True  # 直接改了任务属性，标记待保存
             self.manager.save_tasks()
             success = True
         else:
             # 处理单个任务
             success = self.manager.toggle_completion(task_id)
+            if task is None:
+                task = self.manager._by_id.get(task_id)
 
         if success:
-            # 刷新显示
+            self._group_rep_cache.clear()  # 完成状态变化，缓存的代表任务失效
+            # 只有一行（或一个组代表行）的状态变了，优先原地更新该行
+            if task is not None and self._update_task_row(task):
+                return
+            # 行不在当前视图时才整体刷新
             tasks = self.manager.get_tasks_by_date(
                 self.current_date) if self.current_date else self.manager.get_all_tasks_grouped()
             self.display_tasks(tasks)
@@ -1289,18 +1664,22 @@ class TaskManagerApp:
             return
 
         # 多任务组处理
+        deleted_ids = None  # 实际被删除的任务id集合（None表示用户取消）
         if task.is_multi:
-            # 获取组内所有任务
-            group_tasks = [t for t in self.manager.tasks if t.group_id == task.group_id]
+            # 获取组内所有任务（通过group索引，无需扫描全表）
+            group_tasks = self.manager._by_group.get(task.group_id, [])
 
+            # 组代表任务带有原始描述；若选中的是子任务行，用正则去掉序号后缀
+            group_name = task.base_description or _MULTI_SUFFIX_RE.sub('', task.description)
             confirm = messagebox.askyesno(
                 "确认删除",
                 f"这是一个包含{len(group_tasks)}个子任务的任务组\n"
-                f"确定要删除整个'{task.description.split(' (')[0]}'任务组吗?"
+                f"确定要删除整个'{group_name}'任务组吗?"
             )
             if confirm:
-                for t in group_tasks:
-                    self.manager.delete_task(t.id)
+                deleted_ids = {t.id for t in group_tasks}
+                self.manager.delete_tasks(deleted_ids)
+                deleted_ids.add(task.id)  # 组代表行以group_id作为行id
         else:  # 单任务处理
             confirm = messagebox.askyesno(
                 "确认",
@@ -1308,10 +1687,18 @@ class TaskManagerApp:
             )
             if confirm:
                 self.manager.delete_task(task.id)
-
-        # 刷新显示
-        tasks = self.manager.get_tasks_by_date(self.current_date) if self.current_date else self.manager.tasks
-        self.display_tasks(tasks)
+                deleted_ids = {task.id}
+
+        if deleted_ids is None:
+            return  # 用户取消，界面无需变化
+
+        self._group_rep_cache.clear()  # 任务已变动，缓存的代表任务失效
+        # 只删除受影响的行，不重建其余行
+        tree = self.task_tree
+        for iid in deleted_ids:
+            if tree.exists(iid):
+                tree.delete(iid)
+        self.displayed_tasks = [t for t in self.displayed_tasks if t.id not in deleted_ids]
 
     def open_notes(self):
 